@@ -5,6 +5,12 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow.csv as pv
+import requests
+import xlsxwriter
+import hashlib
+import math
 from io import BytesIO
 from datetime import datetime
 
@@ -21,34 +27,106 @@ st.title("🇰🇪 Jiinue Growth Programme – National Microdata Integrity Dash
 sheet_url = "https://docs.google.com/spreadsheets/d/1LDPRGnR5jlzIMP6RJ9gAcB5m91OO_Wf_1_4liYtVPYM/edit?usp=sharing"
 csv_url = sheet_url.replace("/edit?usp=sharing", "/export?format=csv")
 
-@st.cache_data(ttl=300)
-def load_data():
-    df = pd.read_csv(csv_url)
+id_col = "WHAT IS YOUR NATIONAL ID?"
+phone_col = "Business phone number"
+county_col = "Business Location"
+
+# pd.read_csv's default NA markers, so blank and "N/A"-style cells load as
+# missing rather than as literal strings
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+def parse_sheet(payload):
+    # Arrow parses blocks in parallel; one block spanning the whole payload
+    # trades that parallelism for type inference over every row, so a late
+    # non-numeric value cannot break a column typed from the first megabyte
+    table = pv.read_csv(
+        BytesIO(payload),
+        read_options=pv.ReadOptions(block_size=max(len(payload), 1 << 20)),
+        parse_options=pv.ParseOptions(newlines_in_values=True),
+        # Parse Google Forms timestamps (month-first, like pandas) in the reader
+        convert_options=pv.ConvertOptions(
+            timestamp_parsers=[pv.ISO8601, "%m/%d/%Y %H:%M:%S", "%m/%d/%Y"],
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    # Mangle repeated headers the way pd.read_csv does ("Col", "Col.1", ...)
+    names = pd.Series(table.column_names)
+    repeat = names.groupby(names).cumcount()
+    table = table.rename_columns(names.where(repeat == 0, names + "." + repeat.astype(str)).tolist())
+
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
     df.columns = df.columns.str.strip()
-    return df
+
+    # Low-cardinality grouping key: int codes instead of per-row strings
+    df[county_col] = df[county_col].astype("category")
+
+    # Columns the reader already typed are just converted to numpy datetime64;
+    # anything left as text is parsed here, once per load
+    if "Timestamp" in df.columns:
+        df["Timestamp"] = pd.to_datetime(df["Timestamp"], errors="coerce")
+    elif "Training date" in df.columns:
+        df["Timestamp"] = pd.to_datetime(df["Training date"], errors="coerce")
+    else:
+        df["Timestamp"] = pd.NaT
+
+    # Zone-aware values (ISO timestamps ending in "Z") are kept as naive UTC, so
+    # the date search compares datetime64 rather than Timestamp objects
+    if df["Timestamp"].dt.tz is not None:
+        df["Timestamp"] = df["Timestamp"].dt.tz_convert(None)
+
+    # Chronological order (NaT last) lets date filters binary-search
+    return df.sort_values("Timestamp", kind="stable", ignore_index=True)
+
+# Last validators and parsed frame, shared across sessions for conditional GETs
+@st.cache_resource
+def sheet_snapshot():
+    return {}
+
+# A shared resource, so each rerun reads the raw frame (sidebar bounds, county
+# list) without unpickling a copy; nothing downstream mutates it
+@st.cache_resource(ttl=300, show_spinner="Fetching sheet…")
+def load_data(url):
+    snapshot = sheet_snapshot()
+    headers = {"Accept-Encoding": "gzip"}
+    if snapshot.get("url") == url:
+        if snapshot.get("etag"):
+            headers["If-None-Match"] = snapshot["etag"]
+        if snapshot.get("last_modified"):
+            headers["If-Modified-Since"] = snapshot["last_modified"]
+
+    response = requests.get(url, headers=headers, timeout=60)
+    # Unchanged since the last fetch: skip both the download and the parse
+    if response.status_code == 304:
+        return snapshot["df"], snapshot["version"]
+    response.raise_for_status()
+
+    df = parse_sheet(response.content)
+    # Content hash of the payload; downstream caches are keyed on it so they
+    # never outlive the sheet they were computed from
+    version = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+    snapshot.clear()
+    if "ETag" in response.headers or "Last-Modified" in response.headers:
+        snapshot.update(
+            url=url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            version=version,
+            df=df,
+        )
+    return df, version
 
 # Refresh button
 if st.button("🔄 Refresh Dataset"):
+    load_data.clear()
     st.cache_data.clear()
     st.rerun()
 
-df_raw = load_data().copy()
-
-
-# =============================================================================
-# BASIC CLEANUP
-# =============================================================================
-id_col = "WHAT IS YOUR NATIONAL ID?"
-phone_col = "Business phone number"
-county_col = "Business Location"
-
-# Parse timestamp
-if "Timestamp" in df_raw.columns:
-    df_raw["Timestamp"] = pd.to_datetime(df_raw["Timestamp"], errors="coerce")
-elif "Training date" in df_raw.columns:
-    df_raw["Timestamp"] = pd.to_datetime(df_raw["Training date"], errors="coerce")
-else:
-    df_raw["Timestamp"] = pd.NaT
+df_raw, data_version = load_data(csv_url)
 
 
 # =============================================================================
@@ -62,48 +140,241 @@ max_date = df_raw["Timestamp"].max()
 start_date = st.sidebar.date_input("Start Date", min_date.date())
 end_date = st.sidebar.date_input("End Date", max_date.date())
 
-all_counties = sorted(df_raw[county_col].dropna().unique())
+# Categories of the county column are already the sorted distinct values
+all_counties = list(df_raw[county_col].cat.categories)
 selected_counties = st.sidebar.multiselect("Filter by County", all_counties, default=[])
 
-df = df_raw.copy()
-df = df[(df["Timestamp"].dt.date >= start_date) & (df["Timestamp"].dt.date <= end_date)]
-
-if len(selected_counties) > 0:
-    df = df[df[county_col].isin(selected_counties)]
-
 
 # =============================================================================
 # DOWNLOAD HELPER
 # =============================================================================
+# Cheap content key for DataFrame arguments of cached helpers: one vectorised
+# row-hash pass digested to 16 bytes, instead of Streamlit's default hashing
+def frame_fingerprint(df):
+    digest = hashlib.blake2b(
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes(), digest_size=16
+    )
+    digest.update(str(list(df.columns)).encode())
+    return digest.hexdigest()
+
+# Pick the typed xlsxwriter method per column once, instead of letting
+# worksheet.write() re-dispatch on every cell
+def excel_cell_writer(worksheet, dtype):
+    if dtype == object or isinstance(dtype, pd.CategoricalDtype):
+        return worksheet.write
+    if pd.api.types.is_bool_dtype(dtype):
+        return worksheet.write_boolean
+    if pd.api.types.is_numeric_dtype(dtype):
+        return worksheet.write_number
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return worksheet.write_datetime
+    if pd.api.types.is_string_dtype(dtype):
+        return worksheet.write_string
+    return worksheet.write
+
+# Internal helper columns (prefixed "_") are not part of the exports
+def public_columns(df):
+    return [c for c in df.columns if not str(c).startswith("_")]
+
+def write_sheet(workbook, name, df, columns, header_format):
+    df = df[columns]
+
+    worksheet = workbook.add_worksheet(name)
+    worksheet.write_row(0, 0, [str(c) for c in df.columns], header_format)
+    worksheet.freeze_panes(1, 0)
+
+    writers = [excel_cell_writer(worksheet, dtype) for dtype in df.dtypes]
+    values = df.astype(object).where(df.notna(), None)
+    for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        for col_idx, value in enumerate(row):
+            if value is not None:
+                writers[col_idx](row_idx, col_idx, value)
+
+# Rows are streamed through xlsxwriter's constant_memory mode. pandas' to_excel
+# writes column by column, which that mode cannot accept, so we write rows here.
+# All sheets share one workbook, so its setup and zip pass are paid once.
+@st.cache_data(hash_funcs={pd.DataFrame: frame_fingerprint})
+def sheets_to_excel_bytes(sheets):
+    buffer = BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {
+        "constant_memory": True,
+        "strings_to_urls": False,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss",
+    })
+    header_format = workbook.add_format({"bold": True})
+    # Sheets in one pack usually share a schema, so the column scan runs once
+    schema, columns = None, None
+    for name, df in sheets.items():
+        if not df.columns.equals(schema):
+            schema, columns = df.columns, public_columns(df)
+        write_sheet(workbook, name, df, columns, header_format)
+
+    workbook.close()
+    return buffer.getvalue()
+
 def df_to_excel_bytes(df):
+    return sheets_to_excel_bytes({"Sheet1": df})
+
+# Columnar alternative for large record-level downloads
+@st.cache_data(hash_funcs={pd.DataFrame: frame_fingerprint})
+def df_to_parquet_bytes(df):
     buffer = BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False)
+    df[public_columns(df)].to_parquet(
+        buffer, engine="pyarrow", compression="zstd", index=False
+    )
     return buffer.getvalue()
 
 
 # =============================================================================
 # DUPLICATE CLASSIFICATION
 # =============================================================================
-df["_id_dup"] = df[id_col].duplicated(keep=False)
-df["_phone_dup"] = df[phone_col].duplicated(keep=False)
-df["_exact_dup"] = df.duplicated(subset=[id_col, phone_col], keep=False)
-
-def classify(row):
-    if not row["_id_dup"] and not row["_phone_dup"]:
-        return "Unique"
-    if row["_exact_dup"]:
-        return "Exact Duplicate (Same ID + Phone)"
-    if row["_id_dup"] and not row["_phone_dup"]:
-        return "Same ID, Different Phone"
-    if row["_phone_dup"] and not row["_id_dup"]:
-        return "Same Phone, Different ID"
-    return "Complex Duplicate"
-
-df["_category"] = df.apply(classify, axis=1)
+DUP_CATEGORIES = [
+    "Unique",
+    "Exact Duplicate (Same ID + Phone)",
+    "Same ID, Different Phone",
+    "Same Phone, Different ID",
+    "Complex Duplicate",
+]
+
+def flag_repeated(codes):
+    return np.bincount(codes)[codes] > 1
+
+# Cached per data version and filter selection, so reruns from unrelated
+# widgets skip the pipeline and a refetched sheet is never mixed with old results
+@st.cache_data(ttl=300)
+def build_classified(data_version, start_date, end_date, counties):
+    df, version = load_data(csv_url)
+    # The sheet was refetched since this run read it: rerun the whole page so
+    # filters and results come from the same data
+    if version != data_version:
+        st.rerun()
+
+    # Half-open datetime64 range found by binary search on the sorted column
+    timestamps = df["Timestamp"].to_numpy()
+    bounds = np.array(
+        [np.datetime64(start_date), np.datetime64(end_date) + np.timedelta64(1, "D")]
+    ).astype(timestamps.dtype)
+    start_pos, end_pos = np.searchsorted(timestamps, bounds)
+    positions = np.arange(start_pos, end_pos)
+
+    if len(counties) > 0:
+        in_counties = df[county_col].iloc[start_pos:end_pos].isin(pd.Index(counties))
+        positions = positions[in_counties.to_numpy()]
+
+    # Factorize each key once; the pair key is built from the integer codes so
+    # all three flags come from bincounts instead of three hash passes
+    id_codes, id_uniques = pd.factorize(df[id_col].take(positions), use_na_sentinel=False)
+    phone_codes, _ = pd.factorize(df[phone_col].take(positions), use_na_sentinel=False)
+
+    # One gather for the selected rows, still in time order; take() returns an
+    # owned frame, so the helper columns below can be added without a copy
+    df = df.take(positions)
+
+    pair_codes, _ = pd.factorize(
+        id_codes.astype(np.int64) * (phone_codes.max(initial=-1) + 1) + phone_codes
+    )
+
+    # Flags stay local arrays; only the resulting _category is kept on the frame
+    id_dup = flag_repeated(id_codes)
+    phone_dup = flag_repeated(phone_codes)
+    exact_dup = flag_repeated(pair_codes)
+
+    # Vectorised classification straight to category codes (first matching rule wins)
+    conditions = [
+        ~id_dup & ~phone_dup,
+        exact_dup,
+        id_dup & ~phone_dup,
+        phone_dup & ~id_dup,
+    ]
+    category_codes = np.select(conditions, [0, 1, 2, 3], default=4).astype(np.int8)
+    df["_category"] = pd.Categorical.from_codes(category_codes, categories=DUP_CATEGORIES)
+
+    # County x category tally as one bincount over packed integer codes
+    county_codes = df[county_col].cat.codes.to_numpy()
+    has_county = county_codes >= 0
+    n_categories = len(DUP_CATEGORIES)
+    tally = np.bincount(
+        county_codes[has_county].astype(np.int64) * n_categories + category_codes[has_county],
+        minlength=len(df[county_col].cat.categories) * n_categories,
+    ).reshape(-1, n_categories)
+
+    county_stats = pd.DataFrame(
+        tally,
+        index=pd.Index(df[county_col].cat.categories, name=county_col),
+        columns=DUP_CATEGORIES,
+    )
+    county_stats = county_stats[tally.sum(axis=1) > 0]
+
+    county_stats["Total_Records"] = county_stats[DUP_CATEGORIES].sum(axis=1)
+    county_stats["Total_Duplicates"] = county_stats["Total_Records"] - county_stats["Unique"]
+
+    county_stats = county_stats.rename(columns={
+        "Exact Duplicate (Same ID + Phone)": "Exact_Duplicates",
+        "Same ID, Different Phone": "SameID_DiffPhone",
+        "Same Phone, Different ID": "SamePhone_DiffID",
+        "Complex Duplicate": "Complex_Duplicates",
+    })[[
+        "Total_Records",
+        "Exact_Duplicates",
+        "SameID_DiffPhone",
+        "SamePhone_DiffID",
+        "Complex_Duplicates",
+        "Total_Duplicates",
+    ]].reset_index()
+
+    county_stats["Duplicate_Rate_%"] = (
+        county_stats["Total_Duplicates"] / county_stats["Total_Records"] * 100
+    ).round(2)
+
+    # Headline numbers fall out of arrays we already have
+    summary = {
+        "total_records": len(df),
+        "unique_people": int(pd.notna(id_uniques).sum()),  # case-level, by ID
+        "category_counts": dict(zip(
+            DUP_CATEGORIES, np.bincount(category_codes, minlength=n_categories).tolist()
+        )),
+    }
+
+    return df, county_stats, summary
+
+# Review order for a duplicate view: records sharing the first key (then the
+# second) sit together, groups in order of first appearance and rows
+# chronological within a group (lexsort is stable)
+def review_order(df, first_col, second_col):
+    first_codes, _ = pd.factorize(df[first_col], use_na_sentinel=False)
+    second_codes, _ = pd.factorize(df[second_col], use_na_sentinel=False)
+    return df.take(np.lexsort((second_codes, first_codes)))
+
+# Per-county category split, cached so reruns of the deep-audit fragment
+# (paging, export format) reuse it instead of re-masking and regrouping
+@st.cache_data(ttl=300)
+def build_county_audit(data_version, start_date, end_date, counties, audit_county):
+    df, _, _ = build_classified(data_version, start_date, end_date, counties)
+    audit_df = df[df[county_col] == audit_county]
+    groups = dict(list(audit_df.groupby("_category", observed=True)))
+    empty_audit = audit_df.iloc[0:0]
+    # "Unique" rows are never shown on their own, so that group is not cached
+    audit_groups = {label: groups.get(label, empty_audit) for label in DUP_CATEGORIES[1:]}
+
+    # Raw records stay chronological; the duplicate views are ordered here,
+    # once per county, with the same-phone view grouped by phone
+    same_phone = "Same Phone, Different ID"
+    for label, group in audit_groups.items():
+        if label == same_phone:
+            audit_groups[label] = review_order(group, phone_col, id_col)
+        else:
+            audit_groups[label] = review_order(group, id_col, phone_col)
+    return audit_df, audit_groups
+
+# The page itself only needs the aggregates; keeping them in their own cache
+# entry means a rerun does not unpickle the whole classified frame
+@st.cache_data(ttl=300)
+def build_overview(data_version, start_date, end_date, counties):
+    _, county_stats, summary = build_classified(data_version, start_date, end_date, counties)
+    return county_stats, summary
 
-# CASE-LEVEL UNIQUE PEOPLE
-unique_people = df[id_col].nunique()
+filters = (data_version, start_date, end_date, tuple(sorted(selected_counties)))
+county_stats, summary = build_overview(*filters)
 
 
 # =============================================================================
@@ -111,15 +382,17 @@ unique_people = df[id_col].nunique()
 # =============================================================================
 st.markdown("## 🧮 EXECUTIVE SUMMARY (National View)")
 
-total_records = len(df)
-unique_records = len(df[df["_category"] == "Unique"])
+total_records = summary["total_records"]
+unique_people = summary["unique_people"]
+category_counts = summary["category_counts"]
+unique_records = category_counts["Unique"]
 
 duplicate_rate = (1 - (unique_records / total_records)) * 100
 
-exact_dups = len(df[df["_category"] == "Exact Duplicate (Same ID + Phone)"])
-same_id_dups = len(df[df["_category"] == "Same ID, Different Phone"])
-same_phone_dups = len(df[df["_category"] == "Same Phone, Different ID"])
-complex_dups = len(df[df["_category"] == "Complex Duplicate"])
+exact_dups = category_counts["Exact Duplicate (Same ID + Phone)"]
+same_id_dups = category_counts["Same ID, Different Phone"]
+same_phone_dups = category_counts["Same Phone, Different ID"]
+complex_dups = category_counts["Complex Duplicate"]
 
 col1, col2, col3 = st.columns(3)
 col1.metric("Total Records (Filtered)", f"{total_records:,}")
@@ -144,25 +417,6 @@ st.markdown("---")
 # =============================================================================
 st.markdown("## 🏛️ COUNTY-LEVEL DUPLICATE INTELLIGENCE")
 
-county_stats = df.groupby(county_col).agg(
-    Total_Records=(id_col, "count"),
-    Exact_Duplicates=("_category", lambda x: (x == "Exact Duplicate (Same ID + Phone)").sum()),
-    SameID_DiffPhone=("_category", lambda x: (x == "Same ID, Different Phone").sum()),
-    SamePhone_DiffID=("_category", lambda x: (x == "Same Phone, Different ID").sum()),
-    Complex_Duplicates=("_category", lambda x: (x == "Complex Duplicate").sum())
-).reset_index()
-
-county_stats["Total_Duplicates"] = (
-    county_stats["Exact_Duplicates"]
-    + county_stats["SameID_DiffPhone"]
-    + county_stats["SamePhone_DiffID"]
-    + county_stats["Complex_Duplicates"]
-)
-
-county_stats["Duplicate_Rate_%"] = (
-    county_stats["Total_Duplicates"] / county_stats["Total_Records"] * 100
-).round(2)
-
 st.dataframe(county_stats.sort_values("Duplicate_Rate_%", ascending=False), use_container_width=True)
 
 st.download_button(
@@ -177,41 +431,89 @@ st.markdown("---")
 # =============================================================================
 # COUNTY DEEP AUDIT
 # =============================================================================
-st.markdown("## 🔍 COUNTY DEEP AUDIT (Record-Level Scrutiny)")
-
-audit_county = st.selectbox("Select County for Deep Audit", sorted(df[county_col].dropna().unique()))
-audit_df = df[df[county_col] == audit_county]
-
-st.metric("Total Rows in County", len(audit_df))
-
-# RAW
-st.markdown("### 📌 Raw Records")
-st.dataframe(audit_df.head(500), use_container_width=True)
-st.download_button(f"⬇️ Download Raw – {audit_county}", df_to_excel_bytes(audit_df), f"RAW_{audit_county}.xlsx")
-
-# Exact
-exact_df = audit_df[audit_df["_category"] == "Exact Duplicate (Same ID + Phone)"]
-st.markdown(f"### 🔁 Exact Duplicates ({len(exact_df)})")
-st.dataframe(exact_df, use_container_width=True)
-st.download_button(f"⬇️ Download Exact – {audit_county}", df_to_excel_bytes(exact_df), f"Exact_{audit_county}.xlsx")
-
-# Same ID diff phone
-sameid_df = audit_df[audit_df["_category"] == "Same ID, Different Phone"]
-st.markdown(f"### 🔄 Same ID, Different Phone ({len(sameid_df)})")
-st.dataframe(sameid_df, use_container_width=True)
-st.download_button(f"⬇️ Download SameID – {audit_county}", df_to_excel_bytes(sameid_df), f"SameID_{audit_county}.xlsx")
-
-# Same phone diff ID
-samephone_df = audit_df[audit_df["_category"] == "Same Phone, Different ID"]
-st.markdown(f"### 📱 Same Phone, Different ID ({len(samephone_df)})")
-st.dataframe(samephone_df, use_container_width=True)
-st.download_button(f"⬇️ Download SamePhone – {audit_county}", df_to_excel_bytes(samephone_df), f"SamePhone_{audit_county}.xlsx")
-
-# Complex duplicates
-complex_df = audit_df[audit_df["_category"] == "Complex Duplicate"]
-st.markdown(f"### 🧬 Complex Duplicates ({len(complex_df)})")
-st.dataframe(complex_df, use_container_width=True)
-st.download_button(f"⬇️ Download Complex – {audit_county}", df_to_excel_bytes(complex_df), f"Complex_{audit_county}.xlsx")
+# Ship one page of rows per rerun; the page picker only appears when needed
+def show_paged(df, label, page_rows):
+    page = 1
+    if len(df) > page_rows:
+        page = st.number_input(
+            f"{label} – Page", min_value=1, max_value=math.ceil(len(df) / page_rows), value=1
+        )
+    st.dataframe(df.iloc[(page - 1) * page_rows:page * page_rows], height=400, use_container_width=True)
+
+# Runs as a fragment: picking another county reruns only this section,
+# not the filters, summary and county table above
+@st.fragment
+def render_county_audit(filters, county_stats):
+    st.markdown("## 🔍 COUNTY DEEP AUDIT (Record-Level Scrutiny)")
+
+    # county_stats holds exactly the counties present in the filtered data, in sorted order
+    audit_county = st.selectbox("Select County for Deep Audit", county_stats[county_col].tolist())
+    audit_df, audit_groups = build_county_audit(*filters, audit_county)
+
+    st.metric("Total Rows in County", len(audit_df))
+
+    exact_df = audit_groups["Exact Duplicate (Same ID + Phone)"]
+    sameid_df = audit_groups["Same ID, Different Phone"]
+    samephone_df = audit_groups["Same Phone, Different ID"]
+    complex_df = audit_groups["Complex Duplicate"]
+
+    # Exports are only serialised once requested for the selected county;
+    # ordinary browsing never pays for the workbook build
+    if st.button("📦 Prepare Downloads"):
+        st.session_state["audit_downloads_for"] = audit_county
+
+    if st.session_state.get("audit_downloads_for") == audit_county:
+        # Only the chosen format is serialised
+        export_format = st.radio(
+            "Download Format",
+            ["Excel audit pack (.xlsx)", "Raw records (.parquet)"],
+            horizontal=True,
+        )
+
+        if export_format.startswith("Excel"):
+            # One workbook with a sheet per view instead of five separate exports
+            st.download_button(
+                f"⬇️ Download Audit Pack – {audit_county}",
+                sheets_to_excel_bytes({
+                    "Raw": audit_df,
+                    "Exact Duplicates": exact_df,
+                    "Same ID, Different Phone": sameid_df,
+                    "Same Phone, Different ID": samephone_df,
+                    "Complex Duplicates": complex_df,
+                }),
+                f"Audit_Pack_{audit_county}.xlsx"
+            )
+        else:
+            st.download_button(
+                f"⬇️ Download Raw (Parquet) – {audit_county}",
+                df_to_parquet_bytes(audit_df),
+                f"RAW_{audit_county}.parquet",
+                mime="application/octet-stream"
+            )
+
+    # Only the chosen view is rendered, so a rerun serialises one table instead
+    # of all five; previews are capped per page and the audit pack always
+    # carries the full set
+    audit_views = {
+        "📌 Raw Records": (audit_df, 500),
+        "🔁 Exact Duplicates": (exact_df, 200),
+        "🔄 Same ID, Different Phone": (sameid_df, 200),
+        "📱 Same Phone, Different ID": (samephone_df, 200),
+        "🧬 Complex Duplicates": (complex_df, 200),
+    }
+    view = st.radio(
+        "View",
+        list(audit_views),
+        horizontal=True,
+        format_func=lambda label: f"{label} ({len(audit_views[label][0]):,})",
+    )
+    view_df, page_rows = audit_views[view]
+
+    st.markdown(f"### {view} ({len(view_df)})")
+    if len(view_df):
+        show_paged(view_df, view[2:], page_rows)
+
+render_county_audit(filters, county_stats)
 
 # =============================================================================
 # FOOTER